@@ -96,6 +96,6 @@ class AdaptersRegistry:
 
 
 	@staticmethod
-	def recalculate_schema():
+	def recalculate_schema(settings_schema: Any|None = None):
 		from .schema import save_schema
-		save_schema(AdaptersRegistry.all)
+		save_schema(AdaptersRegistry.all, settings_schema)
@@ -13,7 +13,7 @@ class Commands:
 	generate_commands = Command(
 		name='Generate Commands/Settings/Schema',
 		key='generate_commands',
-		window_action=lambda window: (CommandsRegistry.generate_commands_and_menus(), AdaptersRegistry.recalculate_schema(), SettingsRegistery.generate_settings()),
+		window_action=lambda window: (CommandsRegistry.generate_commands_and_menus(), AdaptersRegistry.recalculate_schema(SettingsRegistery.regenerate_all())),
 		flags=Command.menu_commands|Command.development
 	)
 	open = Command (
@@ -20,6 +20,7 @@ from .asyncio import (
 	delay,
 	run,
 	run_in_executor,
+	set_executor_max_workers,
 
 	gather,
 	gather_results,
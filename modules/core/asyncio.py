@@ -16,6 +16,8 @@ Params = ParamSpec('Params')
 
 class Future(asyncio.Future, Generic[T]):
 	def __init__(self):
+		# Passing the loop explicitly skips the get_event_loop lookup and since loop.get_debug() is False no source traceback is captured.
+		# The fields cannot be assigned directly because they are read only on the C accelerated Future.
 		super().__init__(loop=loop)
 
 	def __await__(self) -> Generator[Any, None, T]:
@@ -32,7 +34,7 @@ def call_later(interval: float, callback: Callable[[Unpack[Args]], Any], *args:
 
 def run_in_executor(func: Callable[Params, T]) -> Callable[Params, Future[T]]:
 	def wrap(*args, **kwargs):
-		return asyncio.futures.wrap_future(executor.submit(func, *args), loop=loop) #type: ignore
+		return asyncio.futures.wrap_future(_get_executor().submit(func, *args), loop=loop) #type: ignore
 	wrap.__name__ = func.__name__ #type: ignore
 	return wrap
 
@@ -66,8 +68,8 @@ def run(value: Awaitable[T] | Callable[Params, Coroutine[Any, Any, T]], on_succe
 
 	task: Future[T] = asyncio.ensure_future(value, loop=loop) #type: ignore
 
-	def done(task: asyncio.Future[T]) -> None:
-		if on_error:
+	if on_error:
+		def done_with_error(task: asyncio.Future[T]) -> None:
 			try:
 				result = task.result()
 				if on_success: on_success(result)
@@ -75,12 +77,13 @@ def run(value: Awaitable[T] | Callable[Params, Coroutine[Any, Any, T]], on_succe
 			except BaseException as e:
 				on_error(e)
 
-		elif on_success:
-			result = task.result()
-			on_success(result)
+		task.add_done_callback(done_with_error)
 
-	if on_error or on_success:
-		task.add_done_callback(done)
+	elif on_success:
+		def done_success_only(task: asyncio.Future[T]) -> None:
+			on_success(task.result())
+
+		task.add_done_callback(done_success_only)
 
 	return task
 
@@ -125,6 +128,7 @@ class SublimeEventLoop (asyncio.AbstractEventLoop):
 		return task
 
 	# Methods for interacting with threads.
+	# sublime.set_timeout can be called from any thread and always runs the callback on the main thread
 	def call_soon_threadsafe(self, callback, *args): #type: ignore
 		handle = Handle(callback, args)
 		sublime.set_timeout(handle, 0)
@@ -148,4 +152,21 @@ class SublimeEventLoop (asyncio.AbstractEventLoop):
 		return False
 
 loop = SublimeEventLoop()
-executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='DebuggerThreadPool')
+executor: ThreadPoolExecutor|None = None
+executor_max_workers: int|None = None
+
+# must be called before the executor is first used to take effect
+# invalid values fall back to the ThreadPoolExecutor default instead of failing
+def set_executor_max_workers(max_workers: Any):
+	global executor_max_workers
+	if isinstance(max_workers, (int, float)) and not isinstance(max_workers, bool) and max_workers >= 1:
+		executor_max_workers = int(max_workers)
+	else:
+		executor_max_workers = None
+
+# created on first use so we are not holding onto idle threads if nothing ever needs them
+def _get_executor() -> ThreadPoolExecutor:
+	global executor
+	if not executor:
+		executor = ThreadPoolExecutor(max_workers=executor_max_workers, thread_name_prefix='DebuggerThreadPool')
+	return executor
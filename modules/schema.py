@@ -9,7 +9,7 @@ import json
 import os
 
 
-def save_schema(adapters: list[dap.AdapterConfiguration]):
+def save_schema(adapters: list[dap.AdapterConfiguration], settings_schema: Any|None = None):
 
 	allOf: list[Any] = []
 	installed_adapters: list[str] = []
@@ -221,7 +221,7 @@ def save_schema(adapters: list[dap.AdapterConfiguration]):
 				},
 				{
 					'file_patterns': ['debugger.sublime-settings'],
-					'schema': SettingsRegistery.schema(),
+					'schema': settings_schema or SettingsRegistery.schema(),
 				}
 			]
 		}
@@ -1,11 +1,52 @@
 from __future__ import annotations
-from typing import Callable, ForwardRef, Generic, Any, TypeVar
+from typing import Callable, ForwardRef, Generic, Any, TypeVar, get_args
 from . import core
 
 import sublime
+import json
+import textwrap
 
 T = TypeVar('T')
+
+_schema_for_tag: dict[str, dict[str, Any]] = {
+	'bool': { 'type': 'boolean' },
+	'int': { 'type': 'number' },
+	'int|None': { 'type': ['number', 'null'] },
+	'float': { 'type': 'number' },
+	'float|None': { 'type': ['number', 'null'] },
+	'str': { 'type': 'string' },
+	'str|None': { 'type': ['string', 'null'] },
+	'other': { 'type': ['object', 'array'] },
+}
+
+_simple_types = {
+	bool: 'bool',
+	int: 'int',
+	float: 'float',
+	str: 'str',
+}
+
+# only values that cannot be mutated by the caller are cached, containers are copied by sublime.Settings.get on every read
+_cacheable_types = (bool, int, float, str, type(None))
+
+def _resolve_schema_tag(t: Any) -> str:
+	if isinstance(t, ForwardRef):
+		parts = { part.strip() for part in t.__forward_arg__.split('|') }
+		optional = 'None' in parts
+		parts.discard('None')
+
+		if len(parts) == 1:
+			name = parts.pop()
+			if name in ('int', 'float', 'str'):
+				return f'{name}|None' if optional else name
+
+		return 'other'
+
+	return _simple_types.get(t, 'other')
+
 class Setting(Generic[T], object):
+	_instances: list[Setting[Any]] = []
+
 	def __init__(self, key: str, default: T, description: str = '', visible = True, schema: Any|None = None) -> None:
 		self.key = key
 		self.default = default
@@ -13,16 +54,49 @@ class Setting(Generic[T], object):
 		self.visible = visible
 		self.schema = schema
 
+		self._description_lines = textwrap.dedent(description).strip().split('\n')
+		self._description_first_line = self._description_lines[0]
+
+		self._cached_value: T = default
+		self._cached_valid = False
+		self._schema_tag: str|None = None
+
+		Setting._instances.append(self)
+
 	def __get__(self, obj, objtype=None) -> T:
-		return SettingsRegistery.settings.get(self.key, self.default)
+		if self._cached_valid:
+			return self._cached_value
+
+		value = SettingsRegistery.settings.get(self.key, self.default)
+		if isinstance(value, _cacheable_types):
+			self._cached_value = value
+			self._cached_valid = True
+		return value
+
+	@property
+	def schema_tag(self) -> str:
+		# __orig_class__ is only assigned after __init__ so this is resolved on first use
+		if self._schema_tag is None:
+			self._schema_tag = _resolve_schema_tag(get_args(self.__orig_class__)[0]) #type: ignore
+		return self._schema_tag
+
+	def invalidate(self):
+		self._cached_valid = False
 
 	def update(self, value: T):
+		# containers may have been mutated in place by the caller (including the default) so they are always written
+		if isinstance(value, _cacheable_types):
+			current = SettingsRegistery.settings.get(self.key, self.default)
+			if type(current) is type(value) and current == value:
+				return
+
 		SettingsRegistery.settings.set(self.key, value)
+		self._cached_value = value
+		self._cached_valid = isinstance(value, _cacheable_types)
 		SettingsRegistery.save()
 
 	def __set__(self, obj, value: T):
-		SettingsRegistery.settings.set(self.key, value)
-		SettingsRegistery.save()
+		self.update(value)
 
 
 class Settings:
@@ -96,6 +170,14 @@ class Settings:
 		description='Sets a specific path for node if not set adapters that require node to run will use whatever is in your path'
 	)
 
+	executor_max_workers = Setting[int] (
+		key='executor_max_workers',
+		default=16,
+		description='''
+		Maximum number of background threads used for blocking work such as reading from debug adapters. Restart required to take effect
+		'''
+	)
+
 
 	integrated_output_panels = Setting['dict[str, dict[str, str]]'] (
 		key='integrated_output_panels',
@@ -166,85 +248,97 @@ Settings = Settings() # type: ignore
 class SettingsRegistery:
 	settings: sublime.Settings
 
+	_dirty = False
+	_save_scheduled = False
+
 	@staticmethod
 	def initialize(on_updated: Callable[[], None]):
 		SettingsRegistery.settings = sublime.load_settings('debugger.sublime-settings')
+
+		def updated():
+			# the settings file may have been edited by hand so none of the cached values can be trusted
+			for setting in Setting._instances:
+				setting.invalidate()
+			on_updated()
+
+		for setting in Setting._instances:
+			setting.invalidate()
+
 		SettingsRegistery.settings.clear_on_change('debugger_settings')
-		SettingsRegistery.settings.add_on_change('debugger_settings', on_updated)
+		SettingsRegistery.settings.add_on_change('debugger_settings', updated)
 
+	# coalesces multiple settings being updated in a row into a single write of the settings file
 	@staticmethod
 	def save():
-		sublime.save_settings('debugger.sublime-settings')
+		SettingsRegistery._dirty = True
+		if not SettingsRegistery._save_scheduled:
+			SettingsRegistery._save_scheduled = True
+			core.call_later(0.05, SettingsRegistery.flush)
+
+	# writes any pending changes immediately
+	@staticmethod
+	def flush():
+		SettingsRegistery._save_scheduled = False
+		if SettingsRegistery._dirty:
+			SettingsRegistery._dirty = False
+			sublime.save_settings('debugger.sublime-settings')
 
 	@staticmethod
 	def schema():
-		import gc
-		import typing
-		import textwrap
+		properties = {}
+		for setting in Setting._instances:
+			properties[setting.key] = SettingsRegistery._schema_property(setting)
+
+		return SettingsRegistery._schema(properties)
 
+	# writes the default settings file and returns the settings schema building both in a single pass over the settings
+	@staticmethod
+	def regenerate_all():
 		properties = {}
-		for setting in gc.get_objects():
-			if not isinstance(setting, Setting):
-				continue
-
-			t = typing.get_args(setting.__orig_class__)[0] #type: ignore
-
-			schema: dict[str, Any] = {}
-			if setting.schema:
-				schema = setting.schema
-			elif t == bool:
-				schema = { 'type': 'boolean' }
-			elif t == int:
-				schema = { 'type': 'number' }
-			elif t == ForwardRef('int|None'):
-				schema = { 'type': ['number', 'null'] }
-			elif t == float:
-				schema = { 'type': 'number' }
-			elif t == ForwardRef('float|None'):
-				schema = { 'type': ['number', 'null'] }
-			elif t == str:
-				schema = { 'type': 'string' }
-			elif t == ForwardRef('str|None'):
-				schema = { 'type': ['string', 'null'] }
-			else:
-				schema = { 'type': ['object', 'array'] }
-
-			schema['description'] = textwrap.dedent(setting.description).strip().split('\n')[0]
-			properties[setting.key] = schema
+		output: list[str] = ['{\n']
+		for setting in Setting._instances:
+			properties[setting.key] = SettingsRegistery._schema_property(setting)
+			SettingsRegistery._append_settings_entry(setting, output)
+
+		SettingsRegistery._write_settings(output)
+		return SettingsRegistery._schema(properties)
 
+	@staticmethod
+	def _schema(properties: dict[str, Any]):
 		return {
 			'additionalProperties': False,
 			'properties': properties
 		}
 
 	@staticmethod
-	def generate_settings():
-		import gc
-		import json
-		import textwrap
-
-		output = '{\n'
+	def _schema_property(setting: Setting[Any]) -> dict[str, Any]:
+		schema: dict[str, Any] = {}
+		if setting.schema:
+			schema = setting.schema
+		else:
+			schema = dict(_schema_for_tag[setting.schema_tag])
 
-		for setting in gc.get_objects():
-			if not isinstance(setting, Setting):
-				continue
+		schema['description'] = setting._description_first_line
+		return schema
 
-			if not setting.visible: continue
-
-			lines = textwrap.dedent(setting.description).strip().split('\n')
-			comment = ''
-			for line in lines:
-				# skip leading empty lines
-				if not comment and not line: continue
+	@staticmethod
+	def _append_settings_entry(setting: Setting[Any], output: list[str]):
+		if not setting.visible: return
 
-				comment += f'\t// {line}\n'
+		has_comment = False
+		for line in setting._description_lines:
+			# skip leading empty lines
+			if not has_comment and not line: continue
 
-			output += comment
-			output += f'\t{json.dumps(setting.key)}: {json.dumps(setting.default)},'
-			output += '\n\n'
+			has_comment = True
+			output.append(f'\t// {line}\n')
 
+		output.append(f'\t{json.dumps(setting.key)}: {json.dumps(setting.default)},')
+		output.append('\n\n')
 
-		output += '}'
+	@staticmethod
+	def _write_settings(output: list[str]):
+		output.append('}')
 
 		with open(f'{core.package_path()}/debugger.sublime-settings', 'w') as f:
-			f.write(output)
+			f.write(''.join(output))
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 import sublime
+from functools import partial
 
 from ..import ui
 from ..import dap
@@ -27,38 +28,44 @@ class ModulesTabbedView(TabbedView):
 		return self._visible
 
 	def updated(self, session: dap.Session):
-		self._visible = False
-		for session in self.debugger.sessions:
-			if session.modules:
-				self._visible = True
-				break
-
-		self.dirty_header()
-		self.dirty()
+		visible = any(session.modules for session in self.debugger.sessions)
+		if visible != self._visible:
+			self._visible = visible
+			self.dirty_header()
+			self.dirty()
 
-	def is_expanded(self, module: dap.Module):
-		return self.expanded.get(module.id, False)
+		# the module list itself may have changed so it still needs to be rendered while visible
+		elif visible:
+			self.dirty()
 
 	def toggle_expanded(self, module: dap.Module):
-		if self.is_expanded(module):
-			self.expanded[module.id] = False
-		else:
-			self.expanded[module.id] = True
-
+		self.expanded[module.id] = not self.expanded.get(module.id, False)
 		self.dirty()
 
+	def copy_value(self, value: Any):
+		ui.InputList(value)[
+			ui.InputListItem(partial(sublime.set_clipboard, value), "Copy")
+		].run()
+
 	def render(self):
+		open_image = ui.Images.shared.open
+		close_image = ui.Images.shared.close
+		row_height = css.row_height
+		label_secondary = css.label_secondary
+		label_css = css.label
+		expanded = self.expanded
+
 		items: list[ui.div] = []
 		for session in self.debugger.sessions:
-			items.append(ui.div(height=css.row_height)[
+			items.append(ui.div(height=row_height)[
 				ui.text(session.name)
 			])
 
 			for module in session.modules.values():
-				is_expanded = self.is_expanded(module)
-				image_toggle = ui.Images.shared.open if is_expanded else ui.Images.shared.close
-				item = ui.div(height=css.row_height) [
-					ui.icon(image_toggle, on_click=lambda module=module: self.toggle_expanded(module)),
+				is_expanded = expanded.get(module.id, False)
+				image_toggle = open_image if is_expanded else close_image
+				item = ui.div(height=row_height) [
+					ui.icon(image_toggle, on_click=partial(self.toggle_expanded, module)),
 					ui.text(module.name)
 				]
 				items.append(item)
@@ -68,18 +75,13 @@ class ModulesTabbedView(TabbedView):
 						if value is None:
 							return
 
-						def copy():
-							ui.InputList(value)[
-								ui.InputListItem(lambda: sublime.set_clipboard(value), "Copy")
-							].run()
-
 						value_str = str(value)
 						body.append(
 							ui.div(height=3)[
-								ui.span(on_click=copy)[
-									ui.text(label, css=css.label_secondary),
+								ui.span(on_click=partial(self.copy_value, value))[
+									ui.text(label, css=label_secondary),
 									ui.spacer(1),
-									ui.text(value_str, css=css.label),
+									ui.text(value_str, css=label_css),
 								]
 							]
 						)
@@ -50,6 +50,7 @@ def plugin_loaded() -> None:
 
 	core.info('[startup]')
 	SettingsRegistery.initialize(on_updated=updated_settings)
+	core.set_executor_max_workers(Settings.executor_max_workers)
 	AdaptersRegistry.initialize()
 
 	ui.Layout.debug = Settings.development
@@ -64,6 +65,8 @@ def plugin_unloaded() -> None:
 
 	core.info('[shutdown]')
 
+	SettingsRegistery.flush()
+
 	try:
 		core.info("Uninstalling Debugger33")
 		shutil.rmtree(debugger33_path)